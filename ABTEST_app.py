@@ -1,20 +1,101 @@
 import streamlit as st
 from src.testdesign import design_binomial_experiment
 from src.datagen import ABTestGenerator
-from src.plots import plot_ctr, plot_views, plot_p_hist_all, plot_power, plot_p_cdf_all
+from src.plots import plot_ground_truth_pair, plot_power, plot_test_results_grid
 from src.utils import apply_tests
 from src.tests import t_test_clicks, t_test_ctr, mw_test, binom_test, bootstrap_test
 import numpy as np
 
-# Define global variables to store the results
-result_dict_aa = None
-result_dict_ab = None
-p_vals_aa = None
-p_vals_ab = None
+# Built once at import; rebuilding this dict on every rerun costs a dict
+# allocation plus five function lookups, and a stable object keeps the
+# battery identical between the A/A and A/B runs
+TESTS = {
+    "T-test (Clicks)": t_test_clicks,
+    "T-test (CTR)": t_test_ctr,
+    "Mann–Whitney (Clicks)": mw_test,
+    "Binomial (CTR)": binom_test,
+    "Bootstrap (CTR)": bootstrap_test,
+}
+
+
+@st.cache_data(show_spinner=False)
+def _generate_data(base_ctr: float, uplift: float, ctr_beta: int,
+                   skew: float, n_samples: int, n_exp: int = 500,
+                   seed: int = 42) -> dict[str, np.ndarray]:
+    """Generate experiment data, cached on the simulation parameters."""
+    np.random.seed(seed)
+    datagen = ABTestGenerator(base_ctr, uplift, ctr_beta, skew)
+    return datagen.generate_n_experiment(n_samples, n_exp)
+
+
+@st.cache_data(show_spinner=False)
+def _run_tests(base_ctr: float, uplift: float, ctr_beta: int,
+               skew: float, n_samples: int, n_exp: int = 500,
+               seed: int = 42) -> dict[str, dict[str, np.ndarray]]:
+    """
+    Run the full test battery, cached on the simulation parameters.
+
+    Reruns triggered by plot-only inputs (e.g. alpha) hit the cache and
+    skip data generation and all five tests. Only the p-value arrays
+    needed by the plots are returned, sorted once here so the histogram
+    and CDF plotters can both take their presorted fast paths.
+    """
+    results = _generate_data(base_ctr, uplift, ctr_beta, skew,
+                             n_samples, n_exp, seed)
+    test_results = apply_tests(results, TESTS)
+    return {name: {'p_vals': np.sort(data['p_vals'])}
+            for name, data in test_results.items()}
+
+
+@st.fragment
+def _ground_truth_fragment():
+    """Render section 2 without rerunning the rest of the script."""
+    result_dict_aa = st.session_state.get('result_dict_aa')
+    result_dict_ab = st.session_state.get('result_dict_ab')
+    if not result_dict_aa:
+        return
+    st.divider()
+    st.subheader("2. Ground Truth Distributions")
+    # One 2x2 figure instead of four separate renders halves the
+    # Figure/PNG overhead and the Streamlit round-trips for this section
+    plot_ground_truth_pair(result_dict_aa, result_dict_ab, 0)
+
+
+@st.fragment
+def _pvals_fragment():
+    """Render section 3 without rerunning the rest of the script."""
+    p_vals_aa = st.session_state.get('p_vals_aa')
+    p_vals_ab = st.session_state.get('p_vals_ab')
+    if not (p_vals_aa and p_vals_ab):
+        return
+    st.divider()
+    st.subheader("3. A/A and A/B Test Results")
+    # One 2x2 figure instead of four separate renders halves the
+    # Figure/PNG overhead and the Streamlit round-trips for this section
+    plot_test_results_grid(p_vals_aa, p_vals_ab, presorted=True)
+
+
+@st.fragment
+def _power_fragment():
+    """Render section 4; moving the alpha slider only reruns this fragment."""
+    p_vals_ab = st.session_state.get('p_vals_ab')
+    if not p_vals_ab:
+        return
+    st.divider()
+    st.subheader("4. Statistical Power")
+    power_alpha = st.slider("Alpha for Power Calculation",
+                            0.01, 0.2, 0.05, 0.01)
+    plot_power(p_vals_ab, alpha=power_alpha)
 
 
 def main():
-    global result_dict_aa, result_dict_ab, p_vals_aa, p_vals_ab
+    # Initialize session state up front; unlike the module globals this
+    # app once used, these survive Streamlit's script reruns, so data
+    # generation only happens on an explicit form submit
+    st.session_state.setdefault('result_dict_aa', None)
+    st.session_state.setdefault('result_dict_ab', None)
+    st.session_state.setdefault('p_vals_aa', None)
+    st.session_state.setdefault('p_vals_ab', None)
 
     # Set page configuration
     st.set_page_config(
@@ -54,11 +135,15 @@ def main():
         base_ctr = base_ctr_pcnt / 100
         mde = mde / 100
 
-        datagen_aa = ABTestGenerator(base_ctr, 0, ctr_beta, skew)
-        datagen_ab = ABTestGenerator(base_ctr, uplift, ctr_beta, skew)
-
-        result_dict_aa = datagen_aa.generate_n_experiment(n_samples, 500)
-        result_dict_ab = datagen_ab.generate_n_experiment(n_samples, 500)
+        result_dict_aa = _generate_data(base_ctr, 0, ctr_beta, skew, n_samples)
+        result_dict_ab = _generate_data(base_ctr, uplift, ctr_beta, skew,
+                                        n_samples)
+        st.session_state['result_dict_aa'] = result_dict_aa
+        st.session_state['result_dict_ab'] = result_dict_ab
+        st.session_state['p_vals_aa'] = _run_tests(
+            base_ctr, 0, ctr_beta, skew, n_samples)
+        st.session_state['p_vals_ab'] = _run_tests(
+            base_ctr, uplift, ctr_beta, skew, n_samples)
 
         clicks_0 = result_dict_aa["clicks_0"][0]
         views_0 = result_dict_aa["views_0"][0]
@@ -82,54 +167,11 @@ def main():
             """
         )
 
-    # Ground Truth Distributions
-    if result_dict_aa:
-        st.divider()
-        st.subheader("2. Ground Truth Distributions")
-        col1, col2 = st.columns(2)
-        with col1:
-            st.write("Data Distributions under H0 (No Effect)")
-            plot_ctr(result_dict_aa, 0)
-            plot_views(result_dict_aa, 0)
-        with col2:
-            st.write("Data Distributions under H1 (With Effect)")
-            plot_ctr(result_dict_ab, 0)
-            plot_views(result_dict_ab, 0)
-
-    # A/A and A/B Test Results
-    if result_dict_aa and result_dict_ab:
-        st.divider()
-        st.subheader("3. A/A and A/B Test Results")
-        p_vals_aa = apply_tests(result_dict_aa, {
-            "T-test (Clicks)": t_test_clicks,
-            "T-test (CTR)": t_test_ctr,
-            "Mann–Whitney (Clicks)": mw_test,
-            "Binomial (CTR)": binom_test,
-            "Bootstrap (CTR)": bootstrap_test,
-        })
-
-        p_vals_ab = apply_tests(result_dict_ab, {
-            "T-test (Clicks)": t_test_clicks,
-            "T-test (CTR)": t_test_ctr,
-            "Mann–Whitney (Clicks)": mw_test,
-            "Binomial (CTR)": binom_test,
-            "Bootstrap (CTR)": bootstrap_test,
-        })
-
-        col1, col2 = st.columns(2)
-        with col1:
-            st.write("A/A Test Results")
-            plot_p_hist_all(p_vals_aa)
-            plot_p_cdf_all(p_vals_aa)
-        with col2:
-            st.write("A/B Test Results")
-            plot_p_hist_all(p_vals_ab)
-            plot_p_cdf_all(p_vals_ab)
-
-        # Power Calculation
-        st.divider()
-        st.subheader("4. Statistical Power")
-        plot_power(p_vals_ab, alpha=alpha)
+    # Each section is a fragment reading from st.session_state, so
+    # interacting with one section reruns only that fragment
+    _ground_truth_fragment()
+    _pvals_fragment()
+    _power_fragment()
 
 if __name__ == "__main__":
     main()
@@ -1,9 +1,340 @@
+import hashlib
+import io
+
 import numpy as np
+import pandas as pd
+import matplotlib
+# Figures are only ever serialized to PNG for Streamlit, so use the
+# headless Agg backend directly instead of whatever is configured
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import seaborn as sns
-from src.utils import empirical_cdf
+from src.utils import empirical_cdf, empirical_cdf_grid
 import streamlit as st
 
+try:
+    from fast_histogram import histogram1d
+except ImportError:  # fast-histogram is optional; fall back to np.histogram
+    histogram1d = None
+
+# Apply the theme once at import time; calling sns.set_theme inside every
+# plot function mutates global rcParams on each Streamlit rerun
+sns.set_theme(style="whitegrid")
+
+
+# st.cache_data cannot hash numpy arrays natively; key them by shape,
+# dtype and a digest of the raw bytes
+_NDARRAY_HASH_FUNCS = {
+    np.ndarray: lambda a: (a.shape, a.dtype.str,
+                           hashlib.blake2b(a.tobytes(),
+                                           digest_size=16).digest())
+}
+
+
+def _p_value_density(p_vals: np.ndarray, bins: int) -> np.ndarray:
+    """Compute density counts for p-values on the fixed (0, 1) range."""
+    # p-value histograms are the ideal fast-histogram case: fixed range
+    # and uniform bins, so the bin-edge search can be skipped entirely
+    if histogram1d is not None:
+        # histogram1d drops samples equal to the range maximum, but
+        # p == 1.0 is routine (two-sided binomial/bootstrap tests); nudge
+        # those into the last bin as np.histogram does
+        clipped = np.minimum(p_vals, np.nextafter(1.0, 0))
+        counts = histogram1d(clipped, bins=bins, range=(0.0, 1.0))
+        return counts / (counts.sum() / bins)
+    counts, _ = np.histogram(p_vals, bins=bins, range=(0, 1), density=True)
+    return counts
+
+
+def _binned_group_probs(a: np.ndarray, b: np.ndarray, bins: int
+                        ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Histogram two groups on shared edges, normalized per group."""
+    # Matches seaborn's stat="probability" with common_norm=False,
+    # without the long-form DataFrame seaborn builds internally
+    edges = np.histogram_bin_edges(np.concatenate([a, b]), bins=bins)
+    counts_0, _ = np.histogram(a, bins=edges)
+    counts_1, _ = np.histogram(b, bins=edges)
+    return counts_0 / counts_0.sum(), counts_1 / counts_1.sum(), edges
+
+
+def _draw_ctr(ax: plt.Axes, ctrs_0: np.ndarray, ctrs_1: np.ndarray) -> tuple:
+    """Draw the ground truth CTR histograms onto an existing Axes."""
+    # Style this Axes locally instead of flipping the global theme to
+    # darkgrid and back on every render
+    ax.set_facecolor('#EAEAF2')
+    ax.grid(True, color='white')
+    palette = sns.color_palette('rocket', n_colors=2)
+
+    probs_0, probs_1, edges = _binned_group_probs(ctrs_0, ctrs_1, bins=50)
+    widths = np.diff(edges)
+    bars_0 = ax.bar(edges[:-1], probs_0, width=widths, align='edge',
+                    alpha=0.5, color=palette[0], label='Control')
+    bars_1 = ax.bar(edges[:-1], probs_1, width=widths, align='edge',
+                    alpha=0.5, color=palette[1], label='Treatment')
+    ax.legend(loc='upper right')
+    ax.set_title('Ground truth user CTR distribution')
+    return bars_0, bars_1
+
+
+def _draw_views(ax: plt.Axes, views_0: np.ndarray, views_1: np.ndarray,
+                fontsize: int = 12, bins: int = 30) -> tuple:
+    """Draw the ground truth views histograms onto an existing Axes."""
+    probs_0, probs_1, edges = _binned_group_probs(views_0, views_1,
+                                                  bins=bins)
+    widths = np.diff(edges)
+    bars_0 = ax.bar(edges[:-1], probs_0, width=widths, align='edge',
+                    alpha=0.5, edgecolor="black", label="Control Group")
+    bars_1 = ax.bar(edges[:-1], probs_1, width=widths, align='edge',
+                    alpha=0.5, edgecolor="black", label="Treatment Group")
+
+    ax.set_title("Ground Truth User Views Distribution", fontsize=fontsize)
+    ax.set_xlabel("Views", fontsize=fontsize)
+    ax.set_ylabel("Probability", fontsize=fontsize)
+    ax.legend(loc="upper right", fontsize=fontsize)
+    ax.tick_params(axis="both", which="major", labelsize=fontsize)
+    return bars_0, bars_1
+
+
+def _draw_p_hist(ax: plt.Axes, p_vals: np.ndarray,
+                 fontsize: int = 12, bins: int = 20) -> None:
+    """Draw a single p-value histogram onto an existing Axes."""
+    # Plot histogram from precomputed counts (p-values live on [0, 1])
+    edges = np.linspace(0, 1, bins + 1)
+    counts = _p_value_density(p_vals, bins)
+    ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge',
+           color="skyblue", edgecolor="black")
+
+    ax.set_title("Distribution of p-values", fontsize=fontsize)
+    ax.set_xlabel("p-value", fontsize=fontsize)
+    ax.set_ylabel("Density", fontsize=fontsize)
+    ax.set_xlim(0, 1)
+    ax.tick_params(axis="both", which="major", labelsize=fontsize)
+
+
+def _draw_p_hist_all(ax: plt.Axes, test_names: tuple[str, ...],
+                     p_arrays: tuple[np.ndarray, ...],
+                     fontsize: int = 12, bins: int = 20,
+                     hist_alpha: float = 0.5,
+                     presorted: bool = False) -> None:
+    """Draw per-test p-value histograms onto an existing Axes."""
+    # Plot histogram for each test from precomputed counts, so matplotlib
+    # only draws `bins` bars per test instead of re-binning the raw arrays.
+    # Pre-sorted arrays (shared with the CDF plot) are binned with a
+    # searchsorted pass instead of a second full histogram scan.
+    edges = np.linspace(0, 1, bins + 1)
+    for test_name, p_vals in zip(test_names, p_arrays):
+        if presorted:
+            idx = np.searchsorted(p_vals, edges, side='left')
+            idx[-1] = p_vals.size  # last bin includes p == 1, as np.histogram
+            counts = np.diff(idx) / (p_vals.size / bins)
+        else:
+            counts = _p_value_density(p_vals, bins)
+        ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge',
+               alpha=hist_alpha, label=test_name, edgecolor="black")
+
+    ax.set_title("Distribution of p-values (All Tests)", fontsize=fontsize)
+    ax.set_xlabel("p-value", fontsize=fontsize)
+    ax.set_ylabel("Density", fontsize=fontsize)
+    ax.set_xlim(0, 1)
+    ax.tick_params(axis="both", which="major", labelsize=fontsize)
+    ax.legend(loc="upper right", fontsize=fontsize)
+
+
+def _draw_p_cdf(ax: plt.Axes, p_vals: np.ndarray, alpha: float = 0.05,
+                fontsize: int = 12, label_fontsize: int = 12) -> None:
+    """Draw the empirical CDF of p-values onto an existing Axes."""
+    # Decimate co-linear sub-pixel steps so the renderer gets roughly one
+    # point per pixel column rather than one per sample
+    p_vals_sorted, probs = empirical_cdf(p_vals, pixel_tol=1 / 600)
+    # Rasterize the dense CDF line so it is drawn as pixels instead of a
+    # vector path with one segment per sample
+    ax.plot(p_vals_sorted, probs, label="Empirical CDF", lw=3,
+            rasterized=True)
+    ax.axvline(x=alpha, color="red", linestyle="--", lw=2,
+               label=f"Alpha = {alpha}")
+    ax.plot([0, 1], [0, 1], color="gray", linestyle=":", lw=2,
+            label="y = x (Uniform)")
+
+    ax.set_xlim(0, 1)
+    ax.set_ylim(0, 1)
+    ax.set_xlabel("p-value", fontsize=label_fontsize)
+    ax.set_ylabel("Cumulative Probability", fontsize=label_fontsize)
+    ax.set_title("Empirical CDF of p-values", fontsize=label_fontsize)
+    ax.tick_params(axis="both", which="major", labelsize=fontsize)
+    ax.legend(loc="lower right", fontsize=fontsize)
+
+
+def _draw_p_cdf_all(ax: plt.Axes, test_names: tuple[str, ...],
+                    p_arrays: tuple[np.ndarray, ...], alpha: float = 0.05,
+                    fontsize: int = 12, label_fontsize: int = 12,
+                    presorted: bool = False) -> None:
+    """Draw per-test empirical CDFs onto an existing Axes."""
+    # All tests share the same number of experiments, so stack into one
+    # (K, N) array and evaluate every CDF on a shared fixed grid in a
+    # single batched kernel; each curve then reuses the same x-array.
+    grid = np.linspace(0, 1, 256)
+    all_probs = empirical_cdf_grid(np.stack(p_arrays), grid,
+                                   presorted=presorted)
+    for test_name, probs in zip(test_names, all_probs):
+        # Rasterized lines avoid path simplification on K dense curves
+        ax.plot(grid, probs, lw=3, label=test_name, rasterized=True)
+
+    ax.axvline(x=alpha, color="red", linestyle="--", lw=2,
+               label=f"Alpha = {alpha}")
+    ax.plot([0, 1], [0, 1], color="gray", linestyle=":", lw=2,
+            label="y = x (Uniform)")
+
+    ax.set_xlim(0, 1)
+    ax.set_ylim(0, 1)
+    ax.set_xlabel("p-value", fontsize=label_fontsize)
+    ax.set_ylabel("Cumulative Probability", fontsize=label_fontsize)
+    ax.set_title("Empirical CDF of p-values (All Tests)",
+                 fontsize=label_fontsize)
+    ax.legend(loc="lower right", fontsize=fontsize)
+    ax.tick_params(axis="both", which="major", labelsize=fontsize)
+
+
+def _compute_powers(test_names: tuple[str, ...],
+                    p_arrays: tuple[np.ndarray, ...],
+                    alpha: float) -> tuple[list[str], np.ndarray]:
+    """Compute per-test power, sorted descending for readability."""
+    # One fused comparison/reduction over a stacked (K, N) array instead
+    # of one pass per test
+    stacked = np.stack(p_arrays)
+    power_values_all = (stacked < alpha).mean(axis=1)
+    order = np.argsort(-power_values_all)
+    return [test_names[i] for i in order], power_values_all[order]
+
+
+def _draw_power(ax: plt.Axes, test_names: tuple[str, ...],
+                p_arrays: tuple[np.ndarray, ...], alpha: float = 0.05,
+                fontsize: int = 12, label_fontsize: int = 12,
+                bar_color: str = "coolwarm") -> None:
+    """Draw the statistical power bar chart onto an existing Axes."""
+    test_names, power_values = _compute_powers(test_names, p_arrays, alpha)
+
+    bar_colors = sns.color_palette(bar_color, n_colors=len(test_names))
+    bars = ax.barh(test_names, power_values, color=bar_colors)
+
+    # Add annotations
+    for bar in bars:
+        width = bar.get_width()
+        ax.text(width + 0.02, bar.get_y() + bar.get_height() / 2,
+                f"{width:.2f}", va="center", fontsize=fontsize)
+
+    ax.set_xlim(0, 1)
+    ax.set_xlabel("Power", fontsize=label_fontsize)
+    ax.set_ylabel("Test Name", fontsize=label_fontsize)
+    ax.set_title("Statistical Power of Tests", fontsize=label_fontsize)
+    ax.tick_params(axis="both", which="major", labelsize=fontsize)
+
+
+def _draw_ground_truth_pair(axes: np.ndarray,
+                            ctrs_h0: tuple[np.ndarray, np.ndarray],
+                            ctrs_h1: tuple[np.ndarray, np.ndarray],
+                            views_h0: tuple[np.ndarray, np.ndarray],
+                            views_h1: tuple[np.ndarray, np.ndarray],
+                            fontsize: int = 12, bins: int = 30) -> tuple:
+    """Draw the H0/H1 CTR and views histograms onto a 2x2 Axes grid."""
+    bar_sets = (
+        _draw_ctr(axes[0, 0], *ctrs_h0),
+        _draw_ctr(axes[0, 1], *ctrs_h1),
+        _draw_views(axes[1, 0], *views_h0, fontsize=fontsize, bins=bins),
+        _draw_views(axes[1, 1], *views_h1, fontsize=fontsize, bins=bins),
+    )
+    axes[0, 0].set_title('User CTR under H0 (No Effect)')
+    axes[0, 1].set_title('User CTR under H1 (With Effect)')
+    axes[1, 0].set_title('User Views under H0 (No Effect)',
+                         fontsize=fontsize)
+    axes[1, 1].set_title('User Views under H1 (With Effect)',
+                         fontsize=fontsize)
+    return bar_sets
+
+
+def _draw_test_results_grid(axes: np.ndarray, test_names: tuple[str, ...],
+                            p_arrays_aa: tuple[np.ndarray, ...],
+                            p_arrays_ab: tuple[np.ndarray, ...],
+                            alpha: float = 0.05, fontsize: int = 10,
+                            bins: int = 20, hist_alpha: float = 0.5,
+                            presorted: bool = False) -> None:
+    """Draw the A/A and A/B histogram/CDF panels onto a 2x2 Axes grid."""
+    _draw_p_hist_all(axes[0, 0], test_names, p_arrays_aa,
+                     fontsize=fontsize, bins=bins, hist_alpha=hist_alpha,
+                     presorted=presorted)
+    _draw_p_hist_all(axes[0, 1], test_names, p_arrays_ab,
+                     fontsize=fontsize, bins=bins, hist_alpha=hist_alpha,
+                     presorted=presorted)
+    _draw_p_cdf_all(axes[1, 0], test_names, p_arrays_aa, alpha=alpha,
+                    fontsize=fontsize, label_fontsize=fontsize,
+                    presorted=presorted)
+    _draw_p_cdf_all(axes[1, 1], test_names, p_arrays_ab, alpha=alpha,
+                    fontsize=fontsize, label_fontsize=fontsize,
+                    presorted=presorted)
+    axes[0, 0].set_title('A/A p-value distribution', fontsize=fontsize)
+    axes[0, 1].set_title('A/B p-value distribution', fontsize=fontsize)
+    axes[1, 0].set_title('A/A p-value CDF', fontsize=fontsize)
+    axes[1, 1].set_title('A/B p-value CDF', fontsize=fontsize)
+
+
+_DRAW_FUNCS = {
+    'ctr': _draw_ctr,
+    'views': _draw_views,
+    'p_hist': _draw_p_hist,
+    'p_hist_all': _draw_p_hist_all,
+    'p_cdf': _draw_p_cdf,
+    'p_cdf_all': _draw_p_cdf_all,
+    'power': _draw_power,
+}
+
+_GRID_DRAW_FUNCS = {
+    'ground_truth_pair': _draw_ground_truth_pair,
+    'test_results_grid': _draw_test_results_grid,
+}
+
+
+@st.cache_data(show_spinner=False, hash_funcs=_NDARRAY_HASH_FUNCS)
+def _render_png(kind: str, payload: tuple, figsize: tuple[int, int],
+                **draw_kwargs) -> bytes:
+    """
+    Build a figure of the given kind and return it as PNG bytes.
+
+    Results are cached on the payload arrays and styling arguments, so
+    repeated renders of identical data skip matplotlib entirely and ship
+    the cached bytes straight to st.image.
+    """
+    fig, ax = plt.subplots(figsize=figsize)
+    _DRAW_FUNCS[kind](ax, *payload, **draw_kwargs)
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', dpi=100, bbox_inches='tight')
+    plt.close(fig)
+    return buf.getvalue()
+
+
+@st.cache_data(show_spinner=False, hash_funcs=_NDARRAY_HASH_FUNCS)
+def _render_grid_png(kind: str, payload: tuple, figsize: tuple[int, int],
+                     **draw_kwargs) -> bytes:
+    """
+    Build a 2x2 multi-axes figure of the given kind as PNG bytes.
+
+    Combining related plots into one figure halves the Figure, canvas and
+    PNG-encoding overhead versus four separate single-axes renders.
+    """
+    fig, axes = plt.subplots(2, 2, figsize=figsize)
+    _GRID_DRAW_FUNCS[kind](axes, *payload, **draw_kwargs)
+    fig.tight_layout()
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', dpi=100)
+    plt.close(fig)
+    return buf.getvalue()
+
+
+def _unpack_pvals(results_pvals: dict[str, dict[str, np.ndarray]]
+                  ) -> tuple[tuple[str, ...], tuple[np.ndarray, ...]]:
+    """Split a per-test results dict into parallel name/array tuples."""
+    names = tuple(results_pvals)
+    arrays = tuple(results_pvals[name]['p_vals'] for name in names)
+    return names, arrays
+
 
 def plot_ctr(results: dict[str, np.ndarray],
              i: int, figsize: tuple[int, int] = (4, 3)) -> None:
@@ -16,17 +347,12 @@ def plot_ctr(results: dict[str, np.ndarray],
         i (int): Index of the experiment to plot.
         figsize (tuple[int, int], optional): Figure size. Defaults to (4, 3).
     """
-    ctrs_0 = results['ctrs_0'][i]
-    ctrs_1 = results['ctrs_1'][i]
-
-    sns.set_theme(style="darkgrid")
-    sns.set_palette('rocket')
-    fig, ax = plt.subplots(figsize=figsize)
-    sns.histplot([ctrs_0, ctrs_1], kde=False, stat="probability",
-                 common_norm=False, multiple="layer", bins=50, ax=ax)
-    ax.set_title('Ground truth user CTR distribution')
-    st.pyplot(fig, use_container_width=True)
-    plt.close(fig)
+    # float32 halves the bytes moved during binning and hashing; the
+    # 50-bin plot cannot resolve the extra float64 precision anyway
+    ctrs_0 = np.ascontiguousarray(results['ctrs_0'][i], dtype=np.float32)
+    ctrs_1 = np.ascontiguousarray(results['ctrs_1'][i], dtype=np.float32)
+    st.image(_render_png('ctr', (ctrs_0, ctrs_1), figsize),
+             use_container_width=True)
 
 
 def plot_views(results: dict[str, np.ndarray], i: int,
@@ -49,29 +375,13 @@ def plot_views(results: dict[str, np.ndarray], i: int,
     if not (0 <= i < len(results['views_0'])) or not (0 <= i < len(results['views_1'])):
         raise IndexError(f"Index {i} is out of bounds for the provided data.")
 
-    views_0 = results['views_0'][i]
-    views_1 = results['views_1'][i]
-
-    # Set theme and figure
-    sns.set_theme(style="whitegrid")
-    fig, ax = plt.subplots(figsize=figsize)
-
-    # Plot histograms
-    sns.histplot([views_0, views_1], kde=False, stat="probability",
-                 common_norm=False, multiple="layer", bins=bins, ax=ax,
-                 palette="coolwarm", edgecolor="black")
-
-    # Customize plot
-    ax.set_title("Ground Truth User Views Distribution", fontsize=fontsize)
-    ax.set_xlabel("Views", fontsize=fontsize)
-    ax.set_ylabel("Probability", fontsize=fontsize)
-    ax.legend(labels=["Control Group", "Treatment Group"], loc="upper right", fontsize=fontsize)
-    ax.tick_params(axis="both", which="major", labelsize=fontsize)
-
-    # Render with Streamlit
-    st.pyplot(fig, use_container_width=True)
-    plt.close(fig)
-
+    # Narrow to float32 at the plot boundary to halve bandwidth in the
+    # binning and hashing steps
+    views_0 = np.ascontiguousarray(results['views_0'][i], dtype=np.float32)
+    views_1 = np.ascontiguousarray(results['views_1'][i], dtype=np.float32)
+    st.image(_render_png('views', (views_0, views_1), figsize,
+                         fontsize=fontsize, bins=bins),
+             use_container_width=True)
 
 
 def plot_p_hist(p_vals: np.ndarray, figsize: tuple[int, int] = (6, 4),
@@ -89,27 +399,17 @@ def plot_p_hist(p_vals: np.ndarray, figsize: tuple[int, int] = (6, 4),
     if not isinstance(p_vals, np.ndarray):
         raise ValueError("p_vals must be a numpy array.")
 
-    # Set theme and figure
-    sns.set_theme(style="whitegrid")
-    fig, ax = plt.subplots(figsize=figsize)
+    # Uniform p-values have ample precision in float32 for a binned plot
+    p_vals = np.ascontiguousarray(p_vals, dtype=np.float32)
+    st.image(_render_png('p_hist', (p_vals,), figsize,
+                         fontsize=fontsize, bins=bins),
+             use_container_width=True)
 
-    # Plot histogram
-    ax.hist(p_vals, bins=bins, density=True, color="skyblue", edgecolor="black")
-
-    # Customize plot
-    ax.set_title("Distribution of p-values", fontsize=fontsize)
-    ax.set_xlabel("p-value", fontsize=fontsize)
-    ax.set_ylabel("Density", fontsize=fontsize)
-    ax.set_xlim(0, 1)
-    ax.tick_params(axis="both", which="major", labelsize=fontsize)
-
-    # Render with Streamlit
-    st.pyplot(fig, use_container_width=True)
-    plt.close(fig)
 
 def plot_p_hist_all(results_pvals: dict[str, dict[str, np.ndarray]],
                     figsize: tuple[int, int] = (8, 5),
-                    fontsize: int = 12, bins: int = 20, hist_alpha: float = 0.5) -> None:
+                    fontsize: int = 12, bins: int = 20, hist_alpha: float = 0.5,
+                    presorted: bool = False) -> None:
     """
     Plot the distribution of p-values for multiple tests.
 
@@ -120,6 +420,8 @@ def plot_p_hist_all(results_pvals: dict[str, dict[str, np.ndarray]],
         fontsize (int, optional): Font size for tick labels. Defaults to 12.
         bins (int, optional): Number of bins for the histogram. Defaults to 20.
         hist_alpha (float, optional): Transparency of histogram bars. Defaults to 0.5.
+        presorted (bool, optional): Whether the p-value arrays are already
+            sorted, allowing a searchsorted binning pass. Defaults to False.
     """
     # Validate input
     if not isinstance(results_pvals, dict) or not all(
@@ -127,27 +429,14 @@ def plot_p_hist_all(results_pvals: dict[str, dict[str, np.ndarray]],
     ):
         raise ValueError("results_pvals must be a dictionary with 'p_vals' arrays.")
 
-    # Set theme and figure
-    sns.set_theme(style="whitegrid")
-    fig, ax = plt.subplots(figsize=figsize)
-
-    # Plot histogram for each test
-    for test_name, test_data in results_pvals.items():
-        ax.hist(test_data['p_vals'], bins=bins, density=True,
-                alpha=hist_alpha, label=test_name, edgecolor="black")
-
-    # Customize plot
-    ax.set_title("Distribution of p-values (All Tests)", fontsize=fontsize)
-    ax.set_xlabel("p-value", fontsize=fontsize)
-    ax.set_ylabel("Density", fontsize=fontsize)
-    ax.set_xlim(0, 1)
-    ax.tick_params(axis="both", which="major", labelsize=fontsize)
-    ax.legend(loc="upper right", fontsize=fontsize)
-
-    # Render with Streamlit
-    st.pyplot(fig, use_container_width=True)
-    plt.close(fig)
-
+    test_names, p_arrays = _unpack_pvals(results_pvals)
+    # Uniform p-values have ample precision in float32 for a binned plot
+    p_arrays = tuple(np.ascontiguousarray(p, dtype=np.float32)
+                     for p in p_arrays)
+    st.image(_render_png('p_hist_all', (test_names, p_arrays), figsize,
+                         fontsize=fontsize, bins=bins, hist_alpha=hist_alpha,
+                         presorted=presorted),
+             use_container_width=True)
 
 
 def plot_p_cdf(p_vals: np.ndarray, alpha: float = 0.05,
@@ -167,36 +456,15 @@ def plot_p_cdf(p_vals: np.ndarray, alpha: float = 0.05,
     if not isinstance(p_vals, np.ndarray):
         raise ValueError("p_vals must be a numpy array.")
 
-    # Set theme and figure
-    sns.set_theme(style="whitegrid")
-    fig, ax = plt.subplots(figsize=figsize)
-
-    # Compute empirical CDF
-    p_vals_sorted, probs = empirical_cdf(p_vals)
-
-    # Plot CDF
-    ax.plot(p_vals_sorted, probs, label="Empirical CDF", lw=3)
-    ax.axvline(x=alpha, color="red", linestyle="--", lw=2, label=f"Alpha = {alpha}")
-    ax.plot([0, 1], [0, 1], color="gray", linestyle=":", lw=2, label="y = x (Uniform)")
-
-    # Customize plot
-    ax.set_xlim(0, 1)
-    ax.set_ylim(0, 1)
-    ax.set_xlabel("p-value", fontsize=label_fontsize)
-    ax.set_ylabel("Cumulative Probability", fontsize=label_fontsize)
-    ax.set_title("Empirical CDF of p-values", fontsize=label_fontsize)
-    ax.tick_params(axis="both", which="major", labelsize=fontsize)
-    ax.legend(loc="lower right", fontsize=fontsize)
-
-    # Render with Streamlit
-    st.pyplot(fig, use_container_width=True)
-    plt.close(fig)
-
+    st.image(_render_png('p_cdf', (p_vals,), figsize, alpha=alpha,
+                         fontsize=fontsize, label_fontsize=label_fontsize),
+             use_container_width=True)
 
 
 def plot_p_cdf_all(p_vals_dict: dict, alpha: float = 0.05,
                    figsize: tuple[int, int] = (8, 5),
-                   fontsize: int = 12, label_fontsize: int = 12) -> None:
+                   fontsize: int = 12, label_fontsize: int = 12,
+                   presorted: bool = False) -> None:
     """
     Plot the empirical CDF of p-values for multiple tests.
 
@@ -207,6 +475,8 @@ def plot_p_cdf_all(p_vals_dict: dict, alpha: float = 0.05,
         figsize (tuple[int, int], optional): Figure size. Defaults to (8, 5).
         fontsize (int, optional): Font size for tick labels. Defaults to 12.
         label_fontsize (int, optional): Font size for axis labels and title. Defaults to 12.
+        presorted (bool, optional): Whether the p-value arrays are already
+            sorted, skipping the batched sort. Defaults to False.
     """
     # Validate input
     if not isinstance(p_vals_dict, dict) or not all(
@@ -214,46 +484,29 @@ def plot_p_cdf_all(p_vals_dict: dict, alpha: float = 0.05,
     ):
         raise ValueError("p_vals_dict must be a dictionary with 'p_vals' arrays.")
 
-    # Set theme and figure
-    sns.set_theme(style="whitegrid")
-    fig, ax = plt.subplots(figsize=figsize)
-
-    # Plot CDF for each test
-    for test_name, data in p_vals_dict.items():
-        p_vals_sorted, probs = empirical_cdf(data['p_vals'])
-        ax.plot(p_vals_sorted, probs, lw=3, label=test_name)
-
-    # Add reference lines
-    ax.axvline(x=alpha, color="red", linestyle="--", lw=2, label=f"Alpha = {alpha}")
-    ax.plot([0, 1], [0, 1], color="gray", linestyle=":", lw=2, label="y = x (Uniform)")
-
-    # Customize plot
-    ax.set_xlim(0, 1)
-    ax.set_ylim(0, 1)
-    ax.set_xlabel("p-value", fontsize=label_fontsize)
-    ax.set_ylabel("Cumulative Probability", fontsize=label_fontsize)
-    ax.set_title("Empirical CDF of p-values (All Tests)", fontsize=label_fontsize)
-    ax.legend(loc="lower right", fontsize=fontsize)
-    ax.tick_params(axis="both", which="major", labelsize=fontsize)
-
-    # Render with Streamlit
-    st.pyplot(fig, use_container_width=True)
-    plt.close(fig)
+    test_names, p_arrays = _unpack_pvals(p_vals_dict)
+    st.image(_render_png('p_cdf_all', (test_names, p_arrays), figsize,
+                         alpha=alpha, fontsize=fontsize,
+                         label_fontsize=label_fontsize, presorted=presorted),
+             use_container_width=True)
 
 
 def plot_power(tests_results, alpha=0.05, figsize=(8, 4), fontsize=12,
-               label_fontsize=12, bar_color="coolwarm"):
+               label_fontsize=12, bar_color="coolwarm", use_altair=True):
     """
     Plot the statistical power of tests.
 
     Args:
-        tests_results (dict): Dictionary containing test results, where each test 
+        tests_results (dict): Dictionary containing test results, where each test
             has a 'p_vals' key with an array of p-values.
         alpha (float, optional): Significance level. Defaults to 0.05.
         figsize (tuple, optional): Figure size. Defaults to (8, 4).
         fontsize (int, optional): Font size for tick labels. Defaults to 12.
         label_fontsize (int, optional): Font size for labels. Defaults to 12.
         bar_color (str, optional): Matplotlib color palette for bars. Defaults to "coolwarm".
+        use_altair (bool, optional): Render with st.bar_chart, which draws
+            client-side and updates without server-side PNG re-encoding.
+            Defaults to True; pass False for the matplotlib figure.
     """
     # Validate input
     if not isinstance(tests_results, dict) or not all(
@@ -261,37 +514,116 @@ def plot_power(tests_results, alpha=0.05, figsize=(8, 4), fontsize=12,
     ):
         raise ValueError("tests_results must be a dictionary with 'p_vals' arrays.")
 
-    # Calculate powers
-    powers = {
-        test_name: np.mean(test_data['p_vals'] < alpha)
-        for test_name, test_data in tests_results.items()
-    }
+    test_names, p_arrays = _unpack_pvals(tests_results)
+    if use_altair:
+        names, power_values = _compute_powers(test_names, p_arrays, alpha)
+        df = pd.DataFrame({'Test': names, 'Power': power_values})
+        # horizontal=True swaps the encodings itself, so pass the logical
+        # x/y columns; sort=False keeps the descending-power row order
+        # instead of re-sorting the category axis alphabetically
+        st.bar_chart(df, x='Test', y='Power', horizontal=True, sort=False,
+                     use_container_width=True)
+        return
+    st.image(_render_png('power', (test_names, p_arrays), figsize,
+                         alpha=alpha, fontsize=fontsize,
+                         label_fontsize=label_fontsize, bar_color=bar_color),
+             use_container_width=True)
+
+
+def _update_hist_bars(ax: plt.Axes, bar_sets: tuple,
+                      probs_0: np.ndarray, probs_1: np.ndarray,
+                      edges: np.ndarray) -> None:
+    """Move existing bar artists to new bin positions and heights."""
+    widths = np.diff(edges)
+    for bars, probs in zip(bar_sets, (probs_0, probs_1)):
+        for bar, x, w, h in zip(bars, edges[:-1], widths, probs):
+            bar.set_x(x)
+            bar.set_width(w)
+            bar.set_height(h)
+    # Mutated patches don't refresh the data limits, so set them directly
+    ax.set_xlim(edges[0], edges[-1])
+    ax.set_ylim(0, max(probs_0.max(), probs_1.max()) * 1.05)
+
+
+def plot_ground_truth_pair(results_aa: dict[str, np.ndarray],
+                           results_ab: dict[str, np.ndarray],
+                           i: int = 0,
+                           figsize: tuple[int, int] = (10, 7),
+                           fontsize: int = 12, bins: int = 30) -> None:
+    """
+    Plot the H0/H1 ground truth CTR and views distributions as one figure.
 
-    # Sort powers for better readability
-    sorted_tests = sorted(powers.items(), key=lambda x: x[1], reverse=True)
-    test_names, power_values = zip(*sorted_tests)
+    The Figure and its bar artists persist in st.session_state; when the
+    generation parameters change, only the bar positions and heights are
+    updated instead of rebuilding four Axes from scratch.
 
-    # Plotting
-    sns.set_theme(style="whitegrid")
-    fig, ax = plt.subplots(figsize=figsize)
-    
-    bar_colors = sns.color_palette(bar_color, n_colors=len(test_names))
-    bars = ax.barh(test_names, power_values, color=bar_colors)
-    
-    # Add annotations
-    for bar in bars:
-        width = bar.get_width()
-        ax.text(width + 0.02, bar.get_y() + bar.get_height() / 2,
-                f"{width:.2f}", va="center", fontsize=fontsize)
+    Args:
+        results_aa (dict[str, np.ndarray]): A/A results (no effect).
+        results_ab (dict[str, np.ndarray]): A/B results (with effect).
+        i (int, optional): Index of the experiment to plot. Defaults to 0.
+        figsize (tuple[int, int], optional): Figure size. Defaults to (10, 7).
+        fontsize (int, optional): Font size for labels and titles. Defaults to 12.
+        bins (int, optional): Number of bins for the views histograms. Defaults to 30.
+    """
+    def _pair(results, key):
+        return (np.ascontiguousarray(results[f'{key}_0'][i],
+                                     dtype=np.float32),
+                np.ascontiguousarray(results[f'{key}_1'][i],
+                                     dtype=np.float32))
+
+    payload = (_pair(results_aa, 'ctrs'), _pair(results_ab, 'ctrs'),
+               _pair(results_aa, 'views'), _pair(results_ab, 'views'))
+    style_key = (figsize, fontsize, bins)
+    state = st.session_state.get('_ground_truth_fig')
+    if state is None or state['style_key'] != style_key:
+        fig, axes = plt.subplots(2, 2, figsize=figsize)
+        bar_sets = _draw_ground_truth_pair(axes, *payload,
+                                           fontsize=fontsize, bins=bins)
+        fig.tight_layout()
+        st.session_state['_ground_truth_fig'] = {
+            'fig': fig, 'axes': axes, 'bar_sets': bar_sets,
+            'style_key': style_key,
+        }
+    else:
+        # Reuse the persistent Figure: recompute histogram heights and
+        # move the existing bar artists, leaving titles/labels/legends
+        # and the Axes themselves untouched
+        fig = state['fig']
+        panel_bins = (50, 50, bins, bins)
+        for ax, bar_sets, (a, b), n_bins in zip(state['axes'].ravel(),
+                                                state['bar_sets'],
+                                                payload, panel_bins):
+            probs_0, probs_1, edges = _binned_group_probs(a, b, n_bins)
+            _update_hist_bars(ax, bar_sets, probs_0, probs_1, edges)
+    st.pyplot(fig, use_container_width=True)
 
-    # Set limits, labels, and title
-    ax.set_xlim(0, 1)
-    ax.set_xlabel("Power", fontsize=label_fontsize)
-    ax.set_ylabel("Test Name", fontsize=label_fontsize)
-    ax.set_title("Statistical Power of Tests", fontsize=label_fontsize)
-    ax.tick_params(axis="both", which="major", labelsize=fontsize)
 
-    # Adjust layout and show the plot
-    plt.tight_layout()
-    st.pyplot(fig, use_container_width=True)
-    plt.close(fig)
+def plot_test_results_grid(p_vals_aa: dict[str, dict[str, np.ndarray]],
+                           p_vals_ab: dict[str, dict[str, np.ndarray]],
+                           alpha: float = 0.05,
+                           figsize: tuple[int, int] = (12, 8),
+                           fontsize: int = 10, bins: int = 20,
+                           hist_alpha: float = 0.5,
+                           presorted: bool = False) -> None:
+    """
+    Plot the A/A and A/B p-value histograms and CDFs as one figure.
+
+    Args:
+        p_vals_aa (dict[str, dict[str, np.ndarray]]): A/A test results.
+        p_vals_ab (dict[str, dict[str, np.ndarray]]): A/B test results.
+        alpha (float, optional): Threshold for statistical significance. Defaults to 0.05.
+        figsize (tuple[int, int], optional): Figure size. Defaults to (12, 8).
+        fontsize (int, optional): Font size for labels and titles. Defaults to 10.
+        bins (int, optional): Number of bins for the histograms. Defaults to 20.
+        hist_alpha (float, optional): Transparency of histogram bars. Defaults to 0.5.
+        presorted (bool, optional): Whether the p-value arrays are already
+            sorted. Defaults to False.
+    """
+    test_names, p_arrays_aa = _unpack_pvals(p_vals_aa)
+    _, p_arrays_ab = _unpack_pvals(p_vals_ab)
+    st.image(_render_grid_png('test_results_grid',
+                              (test_names, p_arrays_aa, p_arrays_ab),
+                              figsize, alpha=alpha, fontsize=fontsize,
+                              bins=bins, hist_alpha=hist_alpha,
+                              presorted=presorted),
+             use_container_width=True)
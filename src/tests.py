@@ -1,5 +1,6 @@
 import numpy as np
 import scipy.stats as stats
+from scipy.special import ndtr
 from src.utils import get_ctrs_hat
 
 
@@ -71,13 +72,17 @@ def mw_test(results: dict[str, np.ndarray]) -> np.ndarray:
     return result
 
 
-def binom_test(results: dict[str, np.ndarray]) -> np.ndarray:
+def binom_test(results: dict[str, np.ndarray],
+               cdf: callable = ndtr) -> np.ndarray:
     """
     Perform binomial test for A/B test results.
 
     Args:
         results (dict[str, np.ndarray]): A dictionary containing
             A/B test results.
+        cdf (callable): Standard normal CDF used to convert z-statistics
+            to p-values. Defaults to scipy.special.ndtr, which skips the
+            distributions-machinery overhead of scipy.stats.norm.cdf.
 
     Returns:
         np.ndarray: An array containing the p-values of binomial test
@@ -93,22 +98,26 @@ def binom_test(results: dict[str, np.ndarray]) -> np.ndarray:
     ctr_H0 = (clicks_0 + clicks_1) / (n_0 + n_1)
     se = np.sqrt(ctr_H0 * (1 - ctr_H0) * (1/n_0 + 1/n_1))
     z_stat = (global_ctr_0 - global_ctr_1) / se
-    result = 2 * np.minimum(
-        stats.norm(0, 1).cdf(z_stat),
-        1 - stats.norm(0, 1).cdf(z_stat)
-    )
+    cdf_vals = cdf(z_stat)
+    result = 2 * np.minimum(cdf_vals, 1 - cdf_vals)
     return result
 
 
 def bootstrap_test(results: dict[str, np.ndarray],
-                   n_bootstrap: int = 1000) -> np.ndarray:
+                   n_bootstrap: int = 1000,
+                   seed: int = 42) -> np.ndarray:
     """
     Perform bootstrap test for A/B test results.
 
+    Resampling weights are drawn in one vectorized call from a seeded
+    Generator, so the whole test stays a handful of C-level matmuls and
+    reductions with reproducible output.
+
     Args:
         results (dict[str, np.ndarray]): A dictionary containing
             A/B test results.
         n_bootstrap (int): Number of bootstrap samples. Defaults to 2000.
+        seed (int): Seed for the random generator. Defaults to 42.
 
     Returns:
         np.ndarray: An array containing the p-values of bootstrap test
@@ -121,9 +130,10 @@ def bootstrap_test(results: dict[str, np.ndarray],
     ctrs_0_hat = clicks_0 / views_0
     ctrs_1_hat = clicks_1 / views_1
 
-    poisson_bootstraps = stats.poisson(1).rvs(
-        (n_bootstrap, ctrs_0_hat.shape[1])
-        ).astype(int)
+    rng = np.random.default_rng(seed)
+    poisson_bootstraps = rng.poisson(
+        1.0, (n_bootstrap, ctrs_0_hat.shape[1])
+    )
 
     values_0 = np.matmul(ctrs_0_hat * views_0, poisson_bootstraps.T)
     weights_0 = np.matmul(views_0, poisson_bootstraps.T)
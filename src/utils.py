@@ -1,5 +1,13 @@
+import os
 from collections import defaultdict
+
 import numpy as np
+from joblib import Parallel, delayed
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; fall back to numpy searchsorted
+    njit = None
 
 
 def get_ctrs_hat(results: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
@@ -28,40 +36,147 @@ def get_ctrs_hat(results: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
 
 def apply_tests(
         results: dict[str, np.ndarray],
-        test_config: dict[str, callable]
+        test_config: dict[str, callable],
+        n_jobs: int = -1
         ) -> dict[str, dict[str, np.ndarray]]:
     """
     Apply statistical tests to A/B test results.
 
+    The experiments are independent, so the experiment axis is split into
+    one chunk per core and each chunk is processed in a worker process.
+    Workers only receive the slices they operate on, not the full arrays.
+
     Args:
         results (Dict[str, np.ndarray]): A dictionary containing
             A/B test results.
         test_config (Dict[str, callable]): A dictionary containing test names
             as keys and corresponding test functions as values.
+        n_jobs (int): Number of worker processes for joblib. Defaults to -1
+            (all cores). Pass 1 to run serially in-process.
 
     Returns:
         dict[str, dict[str, np.ndarray]]: A dictionary containing test results
             for each test.
     """
     test_results = defaultdict(dict)
-    for test_name, test_function in test_config.items():
-        if test_function:
-            test_results[test_name]['p_vals'] = test_function(results)
+    n_runs = results['clicks_0'].shape[0]
+    n_chunks = 1 if n_jobs == 1 else min(os.cpu_count() or 1, n_runs)
+    if n_chunks > 1:
+        chunk_indices = np.array_split(np.arange(n_runs), n_chunks)
+        # Ship only the arrays the test functions read; the ground-truth
+        # ctrs_0/ctrs_1 arrays would just be pickled dead weight
+        needed_keys = ('clicks_0', 'clicks_1', 'views_0', 'views_1')
+        chunks = [{key: results[key][idx] for key in needed_keys}
+                  for idx in chunk_indices]
+        parallel = Parallel(n_jobs=n_jobs, prefer='processes')
+        for test_name, test_function in test_config.items():
+            if test_function:
+                parts = parallel(delayed(test_function)(chunk)
+                                 for chunk in chunks)
+                test_results[test_name]['p_vals'] = np.concatenate(parts)
+    else:
+        for test_name, test_function in test_config.items():
+            if test_function:
+                test_results[test_name]['p_vals'] = test_function(results)
     return test_results
 
 
-def empirical_cdf(p_vals: list[float]) -> tuple[list[float], list[float]]:
+def empirical_cdf(
+        p_vals: np.ndarray,
+        grid: np.ndarray | None = None,
+        pixel_tol: float | None = None
+        ) -> tuple[np.ndarray, np.ndarray]:
     """
     Calculate empirical cumulative distribution function (CDF) of p-values.
 
     Args:
-        p_vals (list[float]): A list of p-values.
+        p_vals (np.ndarray): An array of p-values.
+        grid (np.ndarray | None): Optional fixed grid of x-values. When
+            provided, the CDF is evaluated on the grid via np.searchsorted
+            instead of returning one point per sample, so plots send
+            len(grid) points to the renderer rather than len(p_vals).
+        pixel_tol (float | None): Optional decimation threshold for the
+            full-resolution path. Points whose x and y deviation from the
+            last kept point both stay below the threshold are dropped;
+            because the CDF is monotone this is visually lossless once
+            the threshold is below one pixel (e.g. 1/600).
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: A tuple containing x-values (sorted
+            p-values, or the grid) and corresponding probabilities.
+    """
+    p_vals_sorted = np.sort(p_vals)
+    if grid is not None:
+        probs = np.searchsorted(p_vals_sorted, grid,
+                                side='right') / p_vals_sorted.size
+        return grid, probs
+    n = p_vals_sorted.size
+    probs = np.arange(1, n + 1) / n
+    xs = np.append(p_vals_sorted, 1)
+    ys = np.append(probs, 1)
+    if pixel_tol is not None:
+        # Measure deviation from the last *kept* point, not the immediate
+        # predecessor, so runs of sub-tolerance steps cannot accumulate
+        # into a visible error: the decimated curve stays within
+        # pixel_tol of the full one
+        keep = np.zeros(xs.size, dtype=bool)
+        keep[0] = keep[-1] = True
+        last_x = xs[0]
+        last_y = ys[0]
+        for idx in range(1, xs.size - 1):
+            if (xs[idx] - last_x > pixel_tol
+                    or ys[idx] - last_y > pixel_tol):
+                keep[idx] = True
+                last_x = xs[idx]
+                last_y = ys[idx]
+        xs = xs[keep]
+        ys = ys[keep]
+    return xs, ys
+
+
+if njit is not None:
+    @njit(cache=True, parallel=True)
+    def _ecdf_grid_kernel(samples_2d: np.ndarray,
+                          x_grid: np.ndarray) -> np.ndarray:
+        # Two-pointer merge over sorted rows: each row is walked once in
+        # step with the grid, so the whole batch is O(K * (N + G))
+        n_rows, n = samples_2d.shape
+        n_grid = x_grid.size
+        out = np.empty((n_rows, n_grid))
+        for row in prange(n_rows):
+            j = 0
+            for g in range(n_grid):
+                while j < n and samples_2d[row, j] <= x_grid[g]:
+                    j += 1
+                out[row, g] = j / n
+        return out
+
+
+def empirical_cdf_grid(samples_2d: np.ndarray, x_grid: np.ndarray,
+                       presorted: bool = False) -> np.ndarray:
+    """
+    Evaluate empirical CDFs of several sample sets on a common grid.
+
+    Uses a numba-compiled two-pointer kernel fused across all rows when
+    numba is available, and a per-row np.searchsorted pass otherwise.
+
+    Args:
+        samples_2d (np.ndarray): A (K, N) array with one sample set
+            per row.
+        x_grid (np.ndarray): Grid of x-values to evaluate the CDFs on.
+        presorted (bool): Whether the rows are already sorted.
+            Defaults to False.
 
     Returns:
-        tuple[list[float], list[float]]: A tuple containing sorted p-values
-            and corresponding probabilities.
+        np.ndarray: A (K, len(x_grid)) array of CDF values.
     """
-    p_vals_sorted = sorted(p_vals)
-    n = len(p_vals)
-    probs = [(i + 1) / n for i in range(n)]
-    return p_vals_sorted + [1], probs + [1]
\ No newline at end of file
+    if not presorted:
+        samples_2d = np.sort(samples_2d, axis=1)
+    if njit is not None:
+        return _ecdf_grid_kernel(np.ascontiguousarray(samples_2d),
+                                 np.ascontiguousarray(x_grid))
+    n = samples_2d.shape[1]
+    probs = np.empty((samples_2d.shape[0], x_grid.size))
+    for i, row in enumerate(samples_2d):
+        probs[i] = np.searchsorted(row, x_grid, side='right') / n
+    return probs